@@ -4,9 +4,10 @@ Block Repair Functionality for DGLA Blockchain
 """
 
 import logging
-import datetime
+import time
 from typing import List, Dict, Tuple
 from key_fix import FixedKeyStore
+from dgla_blockchain_store import calculate_hashes, mining_pool, format_timestamp_ns
 
 # Configure logging
 logging.basicConfig(
@@ -25,64 +26,55 @@ class SelfHealingBlockchain(FixedKeyStore):
         
     def detect_tampered_blocks(self) -> List[int]:
         """Find blocks that have been tampered with"""
-        tampered_blocks = []
+        chain = self.blockchain.chain
         
-        # Skip genesis block (index 0)
-        for i in range(1, len(self.blockchain.chain)):
-            block = self.blockchain.chain[i]
-            prev_block = self.blockchain.chain[i-1]
-            
-            # Check block hash
-            if block.hash != block.calculate_hash():
-                tampered_blocks.append(i)
-                continue
-                
-            # Check link to previous block
-            if block.previous_hash != prev_block.hash:
-                tampered_blocks.append(i)
-                
-        return tampered_blocks
+        # Skip genesis block (index 0), rehash only mutated blocks
+        digests = calculate_hashes(chain[1:])
+        
+        # Check block hashes and links to previous blocks
+        return chain.mismatches(digests)
             
     def repair_blockchain(self) -> Tuple[bool, str, List[int]]:
         """Repair tampered blocks by recalculating hashes"""
-        tampered_blocks = self.detect_tampered_blocks()
+        # Start repair at earliest tampered block; later ones are
+        # re-mined regardless, so detection can stop there
+        start_idx = self.blockchain._find_first_tampered()
         
-        if not tampered_blocks:
+        if start_idx is None:
             return True, "No repairs needed", []
             
-        # Start repair at earliest tampered block
-        start_idx = min(tampered_blocks) 
         repaired = []
         
         # Repair each block and subsequent ones to maintain chain
-        for i in range(start_idx, len(self.blockchain.chain)):
-            if i == 0:  # Skip genesis
-                continue
+        with mining_pool(self.blockchain.difficulty) as pool:
+            for i in range(start_idx, len(self.blockchain.chain)):
+                if i == 0:  # Skip genesis
+                    continue
+                    
+                block = self.blockchain.chain[i]
+                prev_block = self.blockchain.chain[i-1]
                 
-            block = self.blockchain.chain[i]
-            prev_block = self.blockchain.chain[i-1]
-            
-            # Update previous hash
-            block.previous_hash = prev_block.hash
-            
-            # Recalculate hash and mine to difficulty
-            block.hash = block.calculate_hash()
-            block.mine_block(self.blockchain.difficulty)
-            
-            repaired.append(i)
-            logger.info(f"Repaired block {i}, new hash: {block.hash[:10]}...")
+                # Update previous hash
+                block.previous_hash = prev_block.hash
+                
+                # Mining to difficulty establishes the new hash
+                block.mine_block(self.blockchain.difficulty, pool)
+                
+                repaired.append(i)
+                logger.info(f"Repaired block {i}, new hash: {block.hash[:10]}...")
             
         # Log the repair
         self.repair_history.append({
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "blocks_repaired": repaired
         })
         
         return True, f"Successfully repaired {len(repaired)} blocks", repaired
             
     def get_repair_history(self) -> List[Dict]:
-        """Get history of blockchain repairs"""
-        return self.repair_history
+        """Get history of blockchain repairs, formatting timestamps on read"""
+        return [dict(event, timestamp=format_timestamp_ns(event["timestamp_ns"]))
+                for event in self.repair_history]
 
 def test_block_repair():
     """Demo the block repair functionality"""
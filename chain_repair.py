@@ -8,10 +8,10 @@ allowing it to automatically recalculate hashes and restore chain integrity
 after tampering is detected.
 """
 
-import datetime
-import copy
+import time
 from typing import Dict, List, Any, Tuple, Optional
-from dgla_blockchain_store import DGLABlockchain, Block, DGLADataStore
+from dgla_blockchain_store import (DGLABlockchain, Block, DGLADataStore, calculate_hashes,
+                                   mining_pool, format_timestamp_ns, EntryIndex, slice_id_key)
 
 class SelfHealingBlockchain(DGLABlockchain):
     """Enhanced blockchain with auto-repair capability"""
@@ -27,65 +27,61 @@ class SelfHealingBlockchain(DGLABlockchain):
         Returns:
             List[int]: Indices of tampered blocks
         """
-        tampered_blocks = []
+        # Skip genesis block (index 0) in verification; only blocks
+        # mutated since their last hash are re-serialized
+        digests = calculate_hashes(self.chain[1:])
         
-        # Skip genesis block (index 0) in verification
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            
-            # Check if block hash matches its contents
-            if current_block.hash != current_block.calculate_hash():
-                tampered_blocks.append(i)
-                continue
-                
-            # Check link to previous block
-            previous_block = self.chain[i-1]
-            if current_block.previous_hash != previous_block.hash:
-                tampered_blocks.append(i)
-                
-        return tampered_blocks
+        # Check each hash against its contents and each link to the
+        # previous block
+        return self.chain.mismatches(digests)
     
     def repair_chain(self) -> Tuple[bool, str, List[int]]:
         """Automatically repair the chain by recalculating hashes
         
+        Each fork_history entry records the first_tampered_block.
+        
         Returns:
             Tuple[bool, str, List[int]]: Success status, message, and list of repaired blocks
         """
-        # First detect which blocks need repair
-        tampered_blocks = self.detect_tampering()
+        # First find where repair has to start; every later block is
+        # re-mined anyway, so the scan stops at the first bad one
+        start_index = self._find_first_tampered()
         
-        if not tampered_blocks:
+        if start_index is None:
             return (True, "Chain integrity intact, no repairs needed", [])
             
-        # Create a backup of the current chain state
-        chain_backup = copy.deepcopy(self.chain)
         self.fork_history.append({
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "reason": "auto-repair",
-            "tampered_blocks": tampered_blocks
+            "first_tampered_block": start_index
         })
         
         # Repair each block and all subsequent blocks
         # We start with the earliest tampered block
-        start_index = min(tampered_blocks)
         repaired_blocks = []
         
-        for i in range(start_index, len(self.chain)):
-            if i == 0:
-                # Skip genesis block
-                continue
-                
-            # Get correct previous hash
-            previous_hash = self.chain[i-1].hash
-            
-            # Update block's previous_hash and recalculate its hash
-            self.chain[i].previous_hash = previous_hash
-            self.chain[i].hash = self.chain[i].calculate_hash()
-            
-            # Remining the block to ensure difficulty is met
-            self.chain[i].mine_block(self.difficulty)
-            
-            repaired_blocks.append(i)
+        # Roll the headers back if mining fails part-way
+        snapshot = self._snapshot_headers(start_index)
+        try:
+            with mining_pool(self.difficulty) as pool:
+                for i in range(start_index, len(self.chain)):
+                    if i == 0:
+                        # Skip genesis block
+                        continue
+                        
+                    # Get correct previous hash
+                    previous_hash = self.chain[i-1].hash
+                    
+                    # Update block's previous_hash
+                    self.chain[i].previous_hash = previous_hash
+                    
+                    # Remining the block establishes its new hash
+                    self.chain[i].mine_block(self.difficulty, pool)
+                    
+                    repaired_blocks.append(i)
+        except BaseException:
+            self._restore_headers(start_index, snapshot)
+            raise
             
         return (True, f"Chain repaired, {len(repaired_blocks)} blocks fixed", repaired_blocks)
         
@@ -98,10 +94,9 @@ class SelfHealingBlockchain(DGLABlockchain):
         tampered_blocks = self.detect_tampering()
         
         # Check shared keys
-        for key_name, key_value in self.shared_keys.items():
-            expected_value = f"NB_KEY_5G_{key_name.upper()}_"
-            if not key_value.startswith(expected_value):
-                return (False, f"Shared key {key_name} has been tampered with")
+        tampered_keys = self._tampered_keys()
+        if tampered_keys:
+            return (False, f"Shared key {tampered_keys[0]} has been tampered with")
         
         if tampered_blocks:
             return (False, f"Chain integrity compromised at blocks {tampered_blocks}")
@@ -116,6 +111,7 @@ class SelfHealingDataStore(DGLADataStore):
         # Override the blockchain with our self-healing version
         self.blockchain = SelfHealingBlockchain()
         self.verification_state = None
+        self._slice_index = EntryIndex(slice_id_key)
         self.repair_history = []
         
     def auto_repair_if_needed(self) -> Tuple[bool, str, List[int]]:
@@ -131,7 +127,7 @@ class SelfHealingDataStore(DGLADataStore):
             
             # Record repair event
             self.repair_history.append({
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp_ns": time.time_ns(),
                 "result": result[0],
                 "message": result[1],
                 "repaired_blocks": result[2]
@@ -162,12 +158,13 @@ class SelfHealingDataStore(DGLADataStore):
             return (False, f"Error verifying ledger: {str(e)}")
             
     def get_repair_history(self) -> List[Dict[str, Any]]:
-        """Get history of chain repairs
+        """Get history of chain repairs, with ISO timestamps added
         
         Returns:
             List[Dict]: Repair history
         """
-        return self.repair_history
+        return [dict(event, timestamp=format_timestamp_ns(event["timestamp_ns"]))
+                for event in self.repair_history]
 
 # Example usage
 def test_chain_repair():
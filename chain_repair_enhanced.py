@@ -7,13 +7,13 @@ This module adds comprehensive auto-repair functionality to the DGLA blockchain,
 fixing both block hash integrity and shared key verification issues.
 """
 
-import datetime
-import copy
+import time
 import hashlib
 import json
 import uuid
 from typing import Dict, List, Any, Tuple, Optional
-from dgla_blockchain_store import DGLABlockchain, Block, DGLADataStore
+from dgla_blockchain_store import (DGLABlockchain, Block, DGLADataStore, calculate_hashes,
+                                   mining_pool, format_timestamp_ns, EntryIndex, slice_id_key)
 
 class EnhancedSelfHealingBlockchain(DGLABlockchain):
     """Enhanced blockchain with comprehensive auto-repair capability"""
@@ -22,6 +22,8 @@ class EnhancedSelfHealingBlockchain(DGLABlockchain):
         """Initialize self-healing blockchain with proper keys"""
         super().__init__(difficulty)
         self.fork_history = []  # Track chain modifications
+        # Index of the first block the last repair re-mined
+        self.last_repair_start: Optional[int] = None
         # Reset shared keys with correct format as per Rogers demo fix
         self.reset_shared_keys()
         
@@ -37,90 +39,103 @@ class EnhancedSelfHealingBlockchain(DGLABlockchain):
             "verification": "NB_KEY_5G_VERIFY_ABCDE"
         }
         
+    def _scan_once(self) -> Tuple[List[str], List[int], Dict[int, bytes]]:
+        """Check the shared keys and every block in a single pass
+        
+        Returns:
+            Tuple[List[str], List[int], Dict[int, bytes]]: Tampered key names,
+            tampered block indices, and the recomputed digest of each block
+        """
+        key_issues = self._tampered_keys()
+        
+        # Genesis is never re-verified; unchanged blocks answer from cache
+        digests = calculate_hashes(self.chain[1:])
+        tampered_blocks = self.chain.mismatches(digests)
+        
+        return key_issues, tampered_blocks, dict(enumerate(digests, 1))
+        
     def detect_tampering(self) -> List[int]:
         """Detect which blocks have been tampered with
         
         Returns:
             List[int]: Indices of tampered blocks
         """
-        tampered_blocks = []
-        
-        # Skip genesis block (index 0) in verification
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            
-            # Check if block hash matches its contents
-            if current_block.hash != current_block.calculate_hash():
-                tampered_blocks.append(i)
-                continue
-                
-            # Check link to previous block
-            previous_block = self.chain[i-1]
-            if current_block.previous_hash != previous_block.hash:
-                tampered_blocks.append(i)
-                
-        return tampered_blocks
+        return self._scan_once()[1]
     
-    def repair_chain(self) -> Tuple[bool, str, List[int]]:
+    def repair_chain(self, scan: Optional[Tuple[List[str], List[int], Dict[int, bytes]]] = None
+                     ) -> Tuple[bool, str, List[int]]:
         """Automatically repair the chain by recalculating hashes
         
+        Args:
+            scan: Result of a _scan_once() the caller already ran, to avoid
+                scanning the chain a second time. Without it, detection
+                stops at the first tampered block.
+        
+        Each fork_history entry records the first_tampered_block (None
+        when only shared keys were repaired).
+        
         Returns:
             Tuple[bool, str, List[int]]: Success status, message, and list of repaired blocks
         """
         repairs = []
         repair_message = []
+        self.last_repair_start = None
         
-        # 1. Check and fix shared keys (Rogers demo fix)
-        key_issues = False
-        for key_name, key_value in self.shared_keys.items():
-            expected_value = f"NB_KEY_5G_{key_name.upper()}_"
-            if not key_value.startswith(expected_value):
-                key_issues = True
+        if scan is not None:
+            key_issues, tampered_blocks, _ = scan
+        else:
+            key_issues = self._tampered_keys()
+            first_tampered = self._find_first_tampered()
+            tampered_blocks = [] if first_tampered is None else [first_tampered]
         
+        # 1. Fix shared keys (Rogers demo fix)
         if key_issues:
             self.reset_shared_keys()
             repair_message.append("Fixed shared key verification issue")
             repairs.append("shared_keys")
         
         # 2. Fix block integrity
-        tampered_blocks = self.detect_tampering()
-        
         if not tampered_blocks and not key_issues:
             return (True, "Chain integrity intact, no repairs needed", [])
             
-        # Create a backup of the current chain state
-        chain_backup = copy.deepcopy(self.chain)
         self.fork_history.append({
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "reason": "auto-repair",
-            "tampered_blocks": tampered_blocks
+            "first_tampered_block": min(tampered_blocks) if tampered_blocks else None
         })
         
         # Repair each block and all subsequent blocks
         # We start with the earliest tampered block
         repaired_blocks = []
+        start_index = len(self.chain)
         if tampered_blocks:
             start_index = min(tampered_blocks)
             
-            for i in range(start_index, len(self.chain)):
-                if i == 0:
-                    # Skip genesis block
-                    continue
-                    
-                # Get correct previous hash
-                previous_hash = self.chain[i-1].hash
-                
-                # Update block's previous_hash and recalculate its hash
-                self.chain[i].previous_hash = previous_hash
-                self.chain[i].hash = self.chain[i].calculate_hash()
-                
-                # Remining the block to ensure difficulty is met
-                self.chain[i].mine_block(self.difficulty)
-                
-                repaired_blocks.append(i)
+            # Keep the original headers until every block is re-mined
+            snapshot = self._snapshot_headers(start_index)
+            try:
+                with mining_pool(self.difficulty) as pool:
+                    for i in range(start_index, len(self.chain)):
+                        if i == 0:
+                            # Skip genesis block
+                            continue
+                            
+                        # Get correct previous hash
+                        previous_hash = self.chain[i-1].hash
+                        
+                        # Update block's previous_hash
+                        self.chain[i].previous_hash = previous_hash
+                        
+                        self.chain[i].mine_block(self.difficulty, pool)
+                        
+                        repaired_blocks.append(i)
+            except BaseException:
+                self._restore_headers(start_index, snapshot)
+                raise
                 
             repair_message.append(f"Fixed {len(repaired_blocks)} blocks ({repaired_blocks})")
             
+        self.last_repair_start = start_index
         return (True, "; ".join(repair_message), repaired_blocks)
         
     def verify_chain_integrity(self) -> Tuple[bool, str]:
@@ -131,26 +146,32 @@ class EnhancedSelfHealingBlockchain(DGLABlockchain):
         Returns:
             Tuple[bool, str]: Integrity status and message
         """
-        # First check shared keys
-        for key_name, key_value in self.shared_keys.items():
-            expected_value = f"NB_KEY_5G_{key_name.upper()}_"
-            if not key_value.startswith(expected_value):
-                return (False, f"Shared key {key_name} has been tampered with")
-        
-        # Then verify block chain integrity
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i-1]
-            
-            # Verify current block hash
-            if current_block.hash != current_block.calculate_hash():
+        key_issues, tampered_blocks, recomputed_digests = self._scan_once()
+        
+        # Report shared keys first, then the earliest bad block
+        if key_issues:
+            return (False, f"Shared key {key_issues[0]} has been tampered with")
+        
+        if tampered_blocks:
+            i = tampered_blocks[0]
+            if self.chain.hashes[i] != recomputed_digests[i]:
                 return (False, f"Block {i} hash invalid")
-            
-            # Verify connection to previous block
-            if current_block.previous_hash != previous_block.hash:
-                return (False, f"Block {i} not connected to previous block")
+            return (False, f"Block {i} not connected to previous block")
         
         return (True, "Ledger verification successful")
+        
+    def repair_confirmed(self) -> bool:
+        """Re-verify the blocks the last repair re-mined against their contents
+        
+        Returns:
+            bool: True if every re-mined block matches its stored hash and link
+        """
+        if self.last_repair_start is None:
+            return self._find_first_tampered() is None
+        start_index = self.last_repair_start
+        chain = self.chain
+        return (calculate_hashes(chain[start_index:]) == chain.hashes[start_index:]
+                and chain.prev_hashes[start_index:] == chain.hashes[start_index - 1:-1])
 
 class EnhancedDataStore(DGLADataStore):
     """Enhanced data store with comprehensive chain repair"""
@@ -164,6 +185,7 @@ class EnhancedDataStore(DGLADataStore):
         self.blockchain = EnhancedSelfHealingBlockchain()
         # Set initial verification state to avoid UI issues (Rogers demo fix)
         self.verification_state = True
+        self._slice_index = EntryIndex(slice_id_key)
         self.repair_history = []
         
     def auto_repair_if_needed(self) -> Tuple[bool, str, List[int]]:
@@ -172,25 +194,29 @@ class EnhancedDataStore(DGLADataStore):
         Returns:
             Tuple[bool, str, List[int]]: Repair status, message, and repaired blocks
         """
-        valid, message = self.blockchain.verify_chain_integrity()
+        # One scan decides whether to repair and tells repair what to fix
+        scan = self.blockchain._scan_once()
+        key_issues, tampered_blocks, _ = scan
         
-        if not valid:
-            result = self.blockchain.repair_chain()
+        if key_issues or tampered_blocks:
+            result = self.blockchain.repair_chain(scan=scan)
             
             # Record repair event with proper logging (Rogers demo fix)
             repair_event = {
-                "timestamp": datetime.datetime.now().isoformat(),
+                "timestamp_ns": time.time_ns(),
                 "result": result[0],
                 "message": result[1],
                 "repaired_blocks": result[2]
             }
             self.repair_history.append(repair_event)
             
-            # Check if repair was successful
-            valid_after, message_after = self.blockchain.verify_chain_integrity()
-            if valid_after:
+            # Check if repair was successful; only the pass/fail bit matters,
+            # the full verification is run just to explain a failure
+            if (not self.blockchain._tampered_keys()
+                    and self.blockchain.repair_confirmed()):
                 return (True, f"Chain repaired successfully: {result[1]}", result[2])
             else:
+                valid_after, message_after = self.blockchain.verify_chain_integrity()
                 return (False, f"Repair attempted but issues remain: {message_after}", result[2])
         
         return (True, "No repairs needed", [])
@@ -214,12 +240,13 @@ class EnhancedDataStore(DGLADataStore):
             return (False, f"Error verifying ledger: {str(e)}")
             
     def get_repair_history(self) -> List[Dict[str, Any]]:
-        """Get history of chain repairs
+        """Get history of chain repairs, with ISO timestamps added
         
         Returns:
             List[Dict]: Repair history
         """
-        return self.repair_history
+        return [dict(event, timestamp=format_timestamp_ns(event["timestamp_ns"]))
+                for event in self.repair_history]
 
 # Example usage
 def test_enhanced_chain_repair():
@@ -7,17 +7,230 @@ This module demonstrates the internal workings of how the DGLA infrastructure
 stores and verifies data using blockchain technology for the Rogers 5G demos.
 """
 
+import os
 import time
 import hashlib
-import json
 import datetime
 import uuid
 import base64
-from typing import Dict, List, Any, Tuple, Optional
+import contextlib
+import functools
+import hmac
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional, Callable
+from tracked_json import (track as _track, encode_scalar as _encode_scalar,
+                          encode_sorted_json as _encode_sorted_json)
+
+# Re-mining below this difficulty is cheaper than starting worker processes
+PARALLEL_MINING_DIFFICULTY = 3
+MINING_WORKERS = os.cpu_count() or 1
+
+# OpenSSL-backed constructor; OpenSSL picks the SHA-NI/AVX2 code path for
+# the running CPU itself, so binding it once is all that is needed here
+_sha256 = hashlib.sha256
+
+
+def batch_sha256(payloads: List[bytes]) -> List[bytes]:
+    """Hash a batch of pre-serialized payloads in a single pass
+    
+    Args:
+        payloads: Canonical byte strings to hash
+        
+    Returns:
+        List[bytes]: Raw 32-byte SHA-256 digest of each payload, in order
+    """
+    sha256 = _sha256
+    return [sha256(payload).digest() for payload in payloads]
+
+
+def _link_key(value: Any) -> bytes:
+    """Raw digest behind a hex hash field, for byte-level comparisons
+    
+    Canonical (lowercase, 64-char) hex maps to its 32 raw bytes. Anything
+    else - the genesis "0", a tampered value - maps to a longer key that
+    can never equal a real digest.
+    
+    Args:
+        value: Hash field value
+        
+    Returns:
+        bytes: Comparison key for the value
+    """
+    if type(value) is str and len(value) == 64:
+        try:
+            digest = bytes.fromhex(value)
+        except ValueError:
+            pass
+        else:
+            if digest.hex() == value:
+                return digest
+    return b"\x00" * 33 + repr(value).encode("utf-8", "surrogatepass")
+
+
+def _difficulty_target(difficulty: int) -> bytes:
+    """Exclusive upper bound on a digest that meets the difficulty
+    
+    Leading hex zeros are leading zero bits of the big-endian digest, and
+    equal-length bytes compare as big-endian numbers, so a digest meets the
+    difficulty exactly when digest < target - one memcmp per attempt.
+    
+    Args:
+        difficulty: Number of leading hex zeros required
+        
+    Returns:
+        bytes: Threshold to compare raw digests against
+    """
+    if difficulty <= 0:
+        # Longer than any digest with every byte at its maximum
+        return b"\xff" * 33
+    return (1 << (256 - 4 * difficulty)).to_bytes(32, "big")
+
+def mine_nonce(prefix: bytes, suffix: bytes, difficulty: int, nonce: int = 0) -> Tuple[int, bytes]:
+    """Search for a nonce giving a hash with the required leading zeros
+    
+    Only the nonce digits change between attempts, so the prefix is
+    hashed once and each attempt resumes from a copy of that midstate,
+    hashing just the nonce and suffix. The zeros are checked by comparing
+    the raw digest against a threshold, so no attempt is hex-encoded.
+    
+    Args:
+        prefix: Serialized block contents before the nonce value
+        suffix: Serialized block contents after the nonce value
+        difficulty: Number of leading zeros required
+        nonce: First nonce to try
+        
+    Returns:
+        tuple: (nonce, digest) of the first valid attempt
+    """
+    target = _difficulty_target(difficulty)
+    midstate = _sha256(prefix)
+    while True:
+        attempt = midstate.copy()
+        attempt.update(str(nonce).encode() + suffix)
+        digest = attempt.digest()
+        if digest < target:
+            return nonce, digest
+        nonce += 1
+
+def _mine_nonce_range(prefix: bytes, suffix: bytes, difficulty: int,
+                      start: int, stop: int) -> Optional[Tuple[int, bytes]]:
+    """Scan one nonce range for a valid hash (runs in a worker process)
+    
+    Returns:
+        tuple: (nonce, digest) of the first valid attempt, or None
+    """
+    target = _difficulty_target(difficulty)
+    midstate = _sha256(prefix)
+    for nonce in range(start, stop):
+        attempt = midstate.copy()
+        attempt.update(str(nonce).encode() + suffix)
+        digest = attempt.digest()
+        if digest < target:
+            return nonce, digest
+    return None
+
+def mine_nonce_parallel(prefix: bytes, suffix: bytes, difficulty: int,
+                        pool: Executor, nonce: int = 0) -> Tuple[int, bytes]:
+    """Search disjoint nonce ranges for a valid hash on a worker pool
+    
+    Each round hands one range per worker; results are read back in range
+    order, so the lowest valid nonce wins and the answer is identical to
+    mine_nonce() for the same starting nonce.
+    
+    Args:
+        prefix: Serialized block contents before the nonce value
+        suffix: Serialized block contents after the nonce value
+        difficulty: Number of leading zeros required
+        pool: Executor running the range scans
+        nonce: First nonce to try
+        
+    Returns:
+        tuple: (nonce, digest) of the first valid attempt
+    """
+    # Size a round to roughly the expected number of attempts
+    stride = max(1024, 16 ** difficulty // MINING_WORKERS)
+    while True:
+        futures = [pool.submit(_mine_nonce_range, prefix, suffix, difficulty,
+                               start, start + stride)
+                   for start in range(nonce, nonce + stride * MINING_WORKERS, stride)]
+        for future in futures:
+            result = future.result()
+            if result is not None:
+                for pending in futures:
+                    pending.cancel()
+                return result
+        nonce += stride * MINING_WORKERS
+
+def mining_pool(difficulty: int):
+    """Worker pool for re-mining a run of blocks at the given difficulty
+    
+    Args:
+        difficulty: Mining difficulty of the chain
+        
+    Returns:
+        Context manager yielding a process pool, or None when mining is
+        cheap enough (or the host small enough) to stay in-process
+    """
+    if difficulty < PARALLEL_MINING_DIFFICULTY or MINING_WORKERS < 2:
+        return contextlib.nullcontext()
+    return ProcessPoolExecutor(max_workers=MINING_WORKERS)
+
+def format_timestamp_ns(timestamp_ns: int) -> str:
+    """Format a time.time_ns() value as a local ISO timestamp
+    
+    Args:
+        timestamp_ns: Nanoseconds since the epoch
+        
+    Returns:
+        str: ISO 8601 timestamp, as datetime.now().isoformat() would give
+    """
+    return datetime.datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+@functools.lru_cache(maxsize=None)
+def _expected_key_prefixes(key_names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Expected value prefix for each shared key name, computed once per key set
+    
+    Args:
+        key_names: Shared key names in dictionary order
+        
+    Returns:
+        tuple: "NB_KEY_5G_<NAME>_" prefix for each name
+    """
+    return tuple(f"NB_KEY_5G_{key_name.upper()}_" for key_name in key_names)
+
+@functools.lru_cache(maxsize=None)
+def _expected_key_block(key_names: Tuple[str, ...]) -> bytes:
+    """All expected shared key prefixes concatenated, for one constant-time compare
+    
+    Args:
+        key_names: Shared key names in dictionary order
+        
+    Returns:
+        bytes: UTF-8 encoding of the joined prefixes
+    """
+    return "".join(_expected_key_prefixes(key_names)).encode()
+
+# Fixed key fragments of a block's canonical (sorted-key) JSON form
+_CANON_DATA = '{"data": '
+_CANON_INDEX = ', "index": '
+_CANON_NONCE = ', "nonce": '
+_CANON_PREVIOUS_HASH = ', "previous_hash": '
+_CANON_TIMESTAMP = ', "timestamp": '
+
+# Block fields mirrored into the owning BlockList's flat arrays
+_LINK_FIELDS = frozenset(("hash", "previous_hash"))
+# Header fields covered by the block hash (data is tracked separately)
+_HASHED_FIELDS = frozenset(("index", "timestamp", "previous_hash", "nonce"))
 
 class Block:
     """A single block in the DGLA blockchain"""
     
+    __slots__ = ("index", "timestamp", "_data", "previous_hash", "nonce", "hash",
+                 "_data_version", "_content_version", "_cached_version", "_digest_cache",
+                 "_prefix_state", "_prefix",
+                 "_ledgers")
+    
     def __init__(self, 
                  index: int, 
                  timestamp: str, 
@@ -33,6 +246,13 @@ class Block:
             previous_hash: Hash of the previous block
             nonce: Value used for mining/verification
         """
+        self._ledgers = None
+        self._data_version = 0
+        self._content_version = 0
+        self._cached_version = None
+        self._prefix_state = None
+        self._prefix = b""
+        self._digest_cache = None
         self.index = index
         self.timestamp = timestamp
         self.data = data
@@ -40,32 +260,158 @@ class Block:
         self.nonce = nonce
         self.hash = self.calculate_hash()
         
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, "_content_version", self._content_version + 1)
+        if name in _LINK_FIELDS and self._ledgers:
+            for ledger in self._live_ledgers():
+                ledger._sync(self)
+            
+    def __getstate__(self) -> Dict[str, Any]:
+        # Chain membership is rebuilt by the BlockList that holds the block
+        return {name: getattr(self, name) for name in Block.__slots__
+                if name != "_ledgers" and hasattr(self, name)}
+        
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        object.__setattr__(self, "_ledgers", None)
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        # A shallow copy would share data still owned by the original block;
+        # give the copy its own tracked containers
+        object.__setattr__(self, "_data", _track(self._data, self))
+            
+    def _join(self, ledger: "BlockList") -> None:
+        """Register a chain holding this block so it hears about changes
+        
+        Args:
+            ledger: Chain the block was added to
+        """
+        ledgers = self._ledgers
+        if ledgers is None:
+            ledgers = {}
+            object.__setattr__(self, "_ledgers", ledgers)
+        ref = ledgers.get(id(ledger))
+        if ref is not None and ref() is ledger:
+            return
+            
+        for key in [key for key, ref in ledgers.items() if ref() is None]:
+            del ledgers[key]
+        ledgers[id(ledger)] = weakref.ref(ledger)
+        
+    def _live_ledgers(self) -> List["BlockList"]:
+        """Chains this block was added to that still exist
+        
+        Returns:
+            List[BlockList]: Live chains, in registration order
+        """
+        return [ledger for ledger in (ref() for ref in self._ledgers.values())
+                if ledger is not None]
+        
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Payload data stored in the block"""
+        return self._data
+        
+    @data.setter
+    def data(self, value: Dict[str, Any]) -> None:
+        self._data = _track(value, self)
+        self._touch()
+        
+    def _touch(self) -> None:
+        """Record a mutation of the block data, invalidating the cached hash"""
+        self._data_version += 1
+        self._content_version += 1
+        if self._ledgers:
+            for ledger in self._live_ledgers():
+                ledger.version += 1
+        
+    def _canonical_bytes(self) -> bytes:
+        """Serialize the hashed block fields in canonical form
+        
+        Every block has the same five fields, so the sorted-key layout is
+        fixed: only the values are encoded, no dict is built or sorted.
+        
+        Returns:
+            bytes: Sorted-key JSON encoding of the block contents
+        """
+        prefix, suffix = self._mining_template()
+        return prefix + str(self.nonce).encode() + suffix
+        
+    def _mining_template(self) -> Tuple[bytes, bytes]:
+        """Serialize the block once, split around the nonce field
+        
+        The fragments spell out the keys in sorted order, so prefix + nonce
+        + suffix is byte-for-byte json.dumps(contents, sort_keys=True).
+        The prefix carries the data payload and is kept until the data or
+        index changes, so re-linking a block (as repair does) only
+        re-encodes the short suffix.
+        
+        Returns:
+            tuple: (prefix, suffix) surrounding the nonce digits
+        """
+        prefix_state = (self._data_version, self.index)
+        if prefix_state != self._prefix_state:
+            self._prefix = (_CANON_DATA + _encode_sorted_json(self.data) +
+                            _CANON_INDEX + _encode_scalar(self.index) +
+                            _CANON_NONCE).encode()
+            self._prefix_state = prefix_state
+        suffix = (_CANON_PREVIOUS_HASH + _encode_scalar(self.previous_hash) +
+                  _CANON_TIMESTAMP + _encode_scalar(self.timestamp) + '}')
+        return self._prefix, suffix.encode()
+        
+    def calculate_digest(self) -> bytes:
+        """Calculate the raw SHA-256 digest of this block
+        
+        The digest is memoized against the content version, which every
+        data mutation and every write to a hashed header field bumps, so an
+        unchanged block is answered with a single integer compare.
+        
+        Returns:
+            bytes: 32-byte SHA-256 digest of the block contents
+        """
+        version = self._content_version
+        if version != self._cached_version:
+            self._digest_cache = _sha256(self._canonical_bytes()).digest()
+            self._cached_version = version
+        return self._digest_cache
+        
     def calculate_hash(self) -> str:
         """Calculate cryptographic hash of this block
         
         Returns:
-            str: SHA-256 hash of the block contents
+            str: SHA-256 hash of the block contents, hex-encoded
         """
-        block_contents = {
-            "index": self.index,
-            "timestamp": self.timestamp,
-            "data": self.data,
-            "previous_hash": self.previous_hash,
-            "nonce": self.nonce
-        }
-        block_string = json.dumps(block_contents, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        return self.calculate_digest().hex()
     
-    def mine_block(self, difficulty: int = 2) -> None:
+    def mine_block(self, difficulty: int = 2, pool: Optional[Executor] = None) -> None:
         """Mine the block by finding a hash with leading zeros
         
+        The search starts from the block's current contents, so callers
+        that just edited a header field need not refresh the hash first.
+        
         Args:
             difficulty: Number of leading zeros required
+            pool: Optional worker pool to split the nonce search across
         """
         target = '0' * difficulty
-        while self.hash[:difficulty] != target:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        current_hash = self.calculate_hash()
+        if current_hash[:difficulty] == target:
+            self.hash = current_hash
+            return
+            
+        prefix, suffix = self._mining_template()
+        if pool is None:
+            nonce, digest = mine_nonce(prefix, suffix, difficulty, self.nonce + 1)
+        else:
+            nonce, digest = mine_nonce_parallel(prefix, suffix, difficulty,
+                                                pool, self.nonce + 1)
+        self.nonce = nonce
+        self.hash = digest.hex()
+        
+        # The winning digest is the hash of the current state
+        self._digest_cache = digest
+        self._cached_version = self._content_version
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert block to dictionary representation
@@ -82,6 +428,286 @@ class Block:
             "hash": self.hash
         }
 
+class BlockList(list):
+    """Chain of blocks that mirrors each block's hash links into flat arrays"""
+    
+    __slots__ = ("hashes", "prev_hashes", "version", "_positions", "__weakref__")
+    
+    def __init__(self, blocks: List[Block] = ()):
+        """Initialize a chain from existing blocks
+        
+        Args:
+            blocks: Blocks in chain order
+        """
+        list.__init__(self)
+        # Bumped when an existing block changes, so lookup indexes rebuild
+        self.version = 0
+        # Raw digests behind each block's hash and previous_hash
+        self.hashes: List[bytes] = []
+        self.prev_hashes: List[bytes] = []
+        # id(block) -> position of its last occurrence in this chain
+        self._positions: Dict[int, int] = {}
+        self.extend(blocks)
+        
+    def __reduce__(self):
+        return (BlockList, (list(self),))
+        
+    def _sync(self, block: Block) -> None:
+        """Copy a block's link fields into the arrays after it changed"""
+        position = self._positions.get(id(block))
+        if position is None or list.__getitem__(self, position) is not block:
+            return
+            
+        block_hash = _link_key(block.hash)
+        previous_hash = _link_key(block.previous_hash)
+        if len(self._positions) == len(self):
+            positions = (position,)
+        else:
+            # Some block occurs more than once; update every occurrence
+            positions = [i for i, member in enumerate(self) if member is block]
+        for position in positions:
+            self.hashes[position] = block_hash
+            self.prev_hashes[position] = previous_hash
+            
+    def mismatches(self, digests: List[bytes]) -> List[int]:
+        """Find blocks failing the content or link check
+        
+        Both checks start as whole-array list comparisons, which run as a
+        single C-level pass over the 32-byte digests; the per-block walk
+        only happens once some block is known to be bad.
+        
+        Args:
+            digests: Recomputed digest of every block after genesis
+            
+        Returns:
+            List[int]: Indices of blocks whose hash or link is wrong
+        """
+        hashes = self.hashes
+        stored = hashes[1:]
+        links = self.prev_hashes[1:]
+        linked = hashes[:-1]
+        if stored == digests and links == linked:
+            return []
+        
+        differs = bytes.__ne__
+        checks = zip(map(differs, stored, digests), map(differs, links, linked))
+        return [i for i, (bad_hash, bad_link) in enumerate(checks, 1)
+                if bad_hash or bad_link]
+            
+    def _reindex(self) -> None:
+        """Rebuild positions and arrays after a structural change"""
+        self.version += 1
+        self._positions = {}
+        for position, block in enumerate(self):
+            block._join(self)
+            self._positions[id(block)] = position
+        self.hashes = [_link_key(block.hash) for block in self]
+        self.prev_hashes = [_link_key(block.previous_hash) for block in self]
+        
+    def append(self, block: Block) -> None:
+        block._join(self)
+        self._positions[id(block)] = len(self)
+        list.append(self, block)
+        self.hashes.append(_link_key(block.hash))
+        self.prev_hashes.append(_link_key(block.previous_hash))
+        
+    def extend(self, blocks: List[Block]) -> None:
+        for block in blocks:
+            self.append(block)
+            
+    def __iadd__(self, blocks):
+        self.extend(blocks)
+        return self
+        
+    def __setitem__(self, index, value):
+        list.__setitem__(self, index, value)
+        self._reindex()
+        
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._reindex()
+        
+    def __imul__(self, count):
+        list.__imul__(self, count)
+        self._reindex()
+        return self
+        
+    def insert(self, index, block):
+        list.insert(self, index, block)
+        self._reindex()
+        
+    def pop(self, *args):
+        block = list.pop(self, *args)
+        self._reindex()
+        return block
+        
+    def remove(self, block):
+        list.remove(self, block)
+        self._reindex()
+        
+    def clear(self):
+        list.clear(self)
+        self._reindex()
+        
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._reindex()
+        
+    def reverse(self):
+        list.reverse(self)
+        self._reindex()
+
+def calculate_hashes(blocks: List[Block]) -> List[bytes]:
+    """Calculate the content digest of each block
+    
+    Blocks whose memoized digest is still current are answered from cache;
+    only the stale ones are serialized and hashed, together in one batch.
+    
+    Args:
+        blocks: Blocks to hash
+        
+    Returns:
+        List[bytes]: Raw SHA-256 digest of each block, in order
+    """
+    stale = [block for block in blocks if block._content_version != block._cached_version]
+    if stale:
+        digests = batch_sha256([block._canonical_bytes() for block in stale])
+        for block, digest in zip(stale, digests):
+            block._digest_cache = digest
+            block._cached_version = block._content_version
+    return [block._digest_cache for block in blocks]
+
+# Key returned for entries an EntryIndex should leave out
+UNINDEXED = object()
+
+def data_id_key(entry: Dict[str, Any]) -> Any:
+    """Index key of a chain entry by its data ID"""
+    return entry.get("data_id")
+
+def slice_id_key(entry: Dict[str, Any]) -> Any:
+    """Index key of a network slice entry by its slice ID"""
+    if entry.get("type") != "network_slice":
+        return UNINDEXED
+    return entry.get("content", {}).get("slice_id")
+
+class EntryIndex:
+    """Map from an entry key to the position of its first entry in a chain
+    
+    The index is a cache over the chain: it only scans blocks appended
+    since the last lookup, and starts over whenever an existing block was
+    changed (BlockList.version moved) or the chain was replaced.
+    """
+    
+    __slots__ = ("key", "locations", "_chain", "_version", "_scanned")
+    
+    def __init__(self, key: Callable[[Dict[str, Any]], Any]):
+        """Initialize an empty index
+        
+        Args:
+            key: Module-level function giving an entry's key, or UNINDEXED
+        """
+        self.key = key
+        self.locations: Dict[Any, Tuple[int, int]] = {}
+        self._chain = None
+        self._version = 0
+        self._scanned = 0
+        
+    def __reduce__(self):
+        # Positions are cheap to rebuild and only valid for this chain object
+        return (EntryIndex, (self.key,))
+        
+    def lookup(self, chain: BlockList, value: Any) -> Optional[Tuple[int, int]]:
+        """Find the first entry with the given key
+        
+        Args:
+            chain: Chain to search
+            value: Key to look up
+            
+        Returns:
+            tuple: (block index, entry index), or None if not found
+        """
+        if chain is not self._chain or chain.version != self._version:
+            self.locations = {}
+            self._chain = chain
+            self._version = chain.version
+            self._scanned = 0
+            
+        key = self.key
+        locations = self.locations
+        for block_index in range(self._scanned, len(chain)):
+            block_data = chain[block_index].data
+            if "entries" not in block_data:
+                continue
+                
+            for entry_index, entry in enumerate(block_data["entries"]):
+                entry_key = key(entry)
+                if entry_key is not UNINDEXED:
+                    locations.setdefault(entry_key, (block_index, entry_index))
+        self._scanned = len(chain)
+        
+        return locations.get(value)
+
+class MerkleAccumulator:
+    """Streaming Merkle root over leaf digests, in O(log n) state
+    
+    edge[level] holds the root of a complete subtree of 2**level leaves
+    that is still waiting for its right sibling; pushing a leaf folds
+    finished pairs upward, so each leaf costs amortized O(1) hashes.
+    root() pairs any level's trailing node with itself, which reproduces
+    the duplicate-the-last rule of DGLABlockchain._calculate_merkle_root.
+    """
+    
+    __slots__ = ("edge", "count")
+    
+    def __init__(self):
+        """Initialize an empty accumulator"""
+        self.edge: List[Optional[bytes]] = []
+        self.count = 0
+        
+    def push(self, leaf: bytes) -> None:
+        """Add the next leaf digest
+        
+        Args:
+            leaf: Raw 32-byte digest of the leaf
+        """
+        edge = self.edge
+        node = leaf
+        level = 0
+        while level < len(edge) and edge[level] is not None:
+            node = _sha256(edge[level] + node).digest()
+            edge[level] = None
+            level += 1
+            
+        if level == len(edge):
+            edge.append(node)
+        else:
+            edge[level] = node
+        self.count += 1
+        
+    def root(self) -> str:
+        """Fold the pending subtrees into the Merkle root
+        
+        Returns:
+            str: Merkle root hash
+        """
+        if not self.count:
+            raise ValueError("Merkle root of an empty leaf set")
+            
+        edge = self.edge
+        carry = None
+        level = 0
+        while True:
+            node = edge[level] if level < len(edge) else None
+            if node is not None and carry is not None:
+                carry = _sha256(node + carry).digest()
+            elif node is not None or carry is not None:
+                lone = carry if node is None else node
+                # Leaves are always paired; above them a lone top node is the root
+                if level > 0 and not any(edge[level + 1:]):
+                    return lone.hex()
+                carry = _sha256(lone + lone).digest()
+            level += 1
+
 class DGLABlockchain:
     """Blockchain implementation for DGLA data storage"""
     
@@ -92,8 +718,10 @@ class DGLABlockchain:
             difficulty: Mining difficulty (leading zeros)
         """
         self.difficulty = difficulty
-        self.chain: List[Block] = []
+        self.chain = BlockList()
         self.pending_data: List[Dict[str, Any]] = []
+        self._reset_pending_merkle()
+        self._id_index = EntryIndex(data_id_key)
         
         # Create genesis block
         self.create_genesis_block()
@@ -105,6 +733,15 @@ class DGLABlockchain:
             "verification": "NB_KEY_5G_VERIFY_ABCDE"
         }
     
+    @property
+    def chain(self) -> BlockList:
+        """Blocks in chain order"""
+        return self._chain
+        
+    @chain.setter
+    def chain(self, blocks: List[Block]) -> None:
+        self._chain = blocks if isinstance(blocks, BlockList) else BlockList(blocks)
+        
     def create_genesis_block(self) -> None:
         """Create the first block in the chain"""
         genesis_block = Block(
@@ -137,7 +774,30 @@ class DGLABlockchain:
         data["data_id"] = data_id
         data["timestamp"] = datetime.datetime.now().isoformat()
         self.pending_data.append(data)
+        if self._merkle_leaves is self.pending_data:
+            encoded = _encode_sorted_json(data)
+            self._merkle_encoded.append(encoded)
+            self._merkle.push(_sha256(encoded.encode()).digest())
         return data_id
+        
+    def _reset_pending_merkle(self) -> None:
+        """Start a fresh Merkle accumulator for the current pending list"""
+        self._merkle = MerkleAccumulator()
+        self._merkle_leaves = self.pending_data
+        # Leaf encodings as queued, to confirm the entries are unchanged
+        self._merkle_encoded: List[str] = []
+        
+    def _pending_merkle_root(self) -> str:
+        """Merkle root of the pending data, from the accumulator when unchanged
+        
+        Returns:
+            str: Merkle root hash
+        """
+        pending = self.pending_data
+        if (self._merkle_leaves is pending
+                and [_encode_sorted_json(data) for data in pending] == self._merkle_encoded):
+            return self._merkle.root()
+        return self._calculate_merkle_root(pending)
     
     def mine_pending_data(self) -> Optional[Block]:
         """Mine a new block with all pending data
@@ -151,7 +811,7 @@ class DGLABlockchain:
         # Create combined data object with all pending items
         combined_data = {
             "entries": self.pending_data,
-            "merkle_root": self._calculate_merkle_root(self.pending_data)
+            "merkle_root": self._pending_merkle_root()
         }
         
         # Create and mine new block
@@ -167,9 +827,51 @@ class DGLABlockchain:
         # Add to chain and clear pending data
         self.chain.append(new_block)
         self.pending_data = []
+        self._reset_pending_merkle()
         
         return new_block
     
+    def _find_first_tampered(self) -> Optional[int]:
+        """Find the earliest tampered block, stopping at the first mismatch
+        
+        Repair re-mines everything from the earliest bad block onward, so
+        it never needs the full list a verification scan produces.
+        
+        Returns:
+            int: Index of the first tampered block, or None if intact
+        """
+        chain = self.chain
+        hashes = chain.hashes
+        prev_hashes = chain.prev_hashes
+        for i in range(1, len(chain)):
+            if prev_hashes[i] != hashes[i-1] or hashes[i] != chain[i].calculate_digest():
+                return i
+        return None
+        
+    def _snapshot_headers(self, start: int) -> List[Tuple[str, str, int]]:
+        """Capture the header fields that chain repair rewrites
+        
+        Args:
+            start: Index of the first block to capture
+            
+        Returns:
+            List[tuple]: (previous_hash, hash, nonce) for each block from start
+        """
+        return [(block.previous_hash, block.hash, block.nonce)
+                for block in self.chain[start:]]
+        
+    def _restore_headers(self, start: int, snapshot: List[Tuple[str, str, int]]) -> None:
+        """Roll block headers back to a snapshot from _snapshot_headers
+        
+        Args:
+            start: Index the snapshot was taken from
+            snapshot: Header fields to restore
+        """
+        for block, (previous_hash, block_hash, nonce) in zip(self.chain[start:], snapshot):
+            block.previous_hash = previous_hash
+            block.hash = block_hash
+            block.nonce = nonce
+        
     def verify_chain_integrity(self) -> Tuple[bool, str]:
         """Verify the integrity of the entire blockchain
         
@@ -179,25 +881,39 @@ class DGLABlockchain:
         Returns:
             tuple: (is_valid, message)
         """
-        for i in range(1, len(self.chain)):
-            current_block = self.chain[i]
-            previous_block = self.chain[i-1]
-            
-            # Verify current block hash
-            if current_block.hash != current_block.calculate_hash():
+        chain = self.chain
+        hashes = chain.hashes
+        prev_hashes = chain.prev_hashes
+        for i in range(1, len(chain)):
+            # Verify current block hash (memoized unless the block changed)
+            if hashes[i] != chain[i].calculate_digest():
                 return (False, f"Block {i} hash invalid")
             
             # Verify connection to previous block
-            if current_block.previous_hash != previous_block.hash:
+            if prev_hashes[i] != hashes[i-1]:
                 return (False, f"Block {i} not connected to previous block")
                 
         # For demo, also verify the deterministic shared keys
-        for key_name, key_value in self.shared_keys.items():
-            expected_value = f"NB_KEY_5G_{key_name.upper()}_"
-            if not key_value.startswith(expected_value):
-                return (False, f"Shared key {key_name} has been tampered with")
+        tampered_keys = self._tampered_keys()
+        if tampered_keys:
+            return (False, f"Shared key {tampered_keys[0]} has been tampered with")
         
         return (True, "Ledger verification successful")
+        
+    def _tampered_keys(self) -> List[str]:
+        """Find shared keys that no longer carry their expected prefix
+        
+        Returns:
+            List[str]: Names of tampered keys, in dictionary order
+        """
+        key_names = tuple(self.shared_keys)
+        prefixes = _expected_key_prefixes(key_names)
+        key_heads = "".join([key_value[:len(prefix)] for key_value, prefix
+                             in zip(self.shared_keys.values(), prefixes)])
+        if hmac.compare_digest(key_heads.encode(), _expected_key_block(key_names)):
+            return []
+        return [key_name for (key_name, key_value), prefix in zip(self.shared_keys.items(), prefixes)
+                if not key_value.startswith(prefix)]
     
     def get_data_by_id(self, data_id: str) -> Optional[Dict[str, Any]]:
         """Find data in the blockchain by its ID
@@ -208,20 +924,20 @@ class DGLABlockchain:
         Returns:
             Dict: The data if found, None otherwise
         """
-        # Search through all blocks
-        for block in self.chain:
-            if "entries" not in block.data:
-                continue
-                
-            for entry in block.data["entries"]:
-                if entry.get("data_id") == data_id:
-                    return entry
-        
-        return None
+        location = self._id_index.lookup(self.chain, data_id)
+        if location is None:
+            return None
+            
+        block_index, entry_index = location
+        return self.chain[block_index].data["entries"][entry_index]
     
     def _calculate_merkle_root(self, data_list: List[Dict[str, Any]]) -> str:
         """Calculate a merkle root hash for a list of data items
         
+        Inner nodes hash the raw 64-byte concatenation of their two child
+        digests; each level is hashed as one batch and only the root is
+        hex-encoded.
+        
         Args:
             data_list: List of data dictionaries
             
@@ -229,8 +945,8 @@ class DGLABlockchain:
             str: Merkle root hash
         """
         # Convert data items to strings and hash them
-        hashes = [hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
-                 for data in data_list]
+        hashes = batch_sha256([_encode_sorted_json(data).encode()
+                               for data in data_list])
                  
         # If odd number of hashes, duplicate the last one
         if len(hashes) % 2 == 1:
@@ -238,18 +954,14 @@ class DGLABlockchain:
             
         # Combine hashes until we get a single root hash
         while len(hashes) > 1:
-            new_hashes = []
-            for i in range(0, len(hashes), 2):
-                combined = hashes[i] + hashes[i+1]
-                new_hash = hashlib.sha256(combined.encode()).hexdigest()
-                new_hashes.append(new_hash)
-            hashes = new_hashes
+            hashes = batch_sha256([left + right
+                                   for left, right in zip(hashes[0::2], hashes[1::2])])
             
             # If odd number of hashes, duplicate the last one
             if len(hashes) % 2 == 1 and len(hashes) > 1:
                 hashes.append(hashes[-1])
         
-        return hashes[0]
+        return hashes[0].hex()
     
     def get_chain_data(self) -> List[Dict[str, Any]]:
         """Get the entire blockchain as a list of dictionaries
@@ -281,6 +993,9 @@ class DGLABlockchain:
             
         return True
 
+# Fields _sign_data adds on top of the signed content
+_SIGNATURE_FIELDS = frozenset(("signature", "signed_at"))
+
 class DGLADataStore:
     """Interface to DGLA data storage system using blockchain"""
     
@@ -288,6 +1003,7 @@ class DGLADataStore:
         """Initialize a new DGLA data store"""
         self.blockchain = DGLABlockchain()
         self.verification_state = None
+        self._slice_index = EntryIndex(slice_id_key)
         
     def store_network_slice(self, slice_data: Dict[str, Any]) -> str:
         """Store network slice in the blockchain
@@ -326,20 +1042,13 @@ class DGLADataStore:
         Returns:
             Dict: The slice data if found
         """
-        # Search for the slice in all blockchain data
-        for block in self.blockchain.chain:
-            if "entries" not in block.data:
-                continue
-                
-            for entry in block.data["entries"]:
-                if entry.get("type") != "network_slice":
-                    continue
-                    
-                content = entry.get("content", {})
-                if content.get("slice_id") == slice_id:
-                    return self._verify_signed_data(content)
-                    
-        return None
+        location = self._slice_index.lookup(self.blockchain.chain, slice_id)
+        if location is None:
+            return None
+            
+        block_index, entry_index = location
+        entry = self.blockchain.chain[block_index].data["entries"][entry_index]
+        return self._verify_signed_data(entry.get("content", {}))
         
     def verify_integrity(self) -> Tuple[bool, str]:
         """Verify the integrity of all stored data
@@ -373,13 +1082,8 @@ class DGLADataStore:
         # Create a copy of the data
         signed_data = data.copy()
         
-        # Create signature using verification key
-        data_string = json.dumps(data, sort_keys=True)
-        signature_data = data_string + self.blockchain.shared_keys["verification"]
-        signature = hashlib.sha256(signature_data.encode()).hexdigest()
-        
-        # Add signature to data
-        signed_data["signature"] = signature
+        # Add signature (using verification key) to data
+        signed_data["signature"] = self._signature(data)
         signed_data["signed_at"] = datetime.datetime.now().isoformat()
         
         return signed_data
@@ -395,18 +1099,29 @@ class DGLADataStore:
         """
         # Create a copy without signature and signed_at
         data_to_verify = {k: v for k, v in signed_data.items() 
-                          if k not in ["signature", "signed_at"]}
+                          if k not in _SIGNATURE_FIELDS}
                           
-        # Recreate signature
-        data_string = json.dumps(data_to_verify, sort_keys=True)
-        signature_data = data_string + self.blockchain.shared_keys["verification"]
-        expected_signature = hashlib.sha256(signature_data.encode()).hexdigest()
-        
-        # Verify signature
-        if signed_data.get("signature") != expected_signature:
+        # Recreate signature and verify it
+        if signed_data.get("signature") != self._signature(data_to_verify):
             return None
             
         return signed_data
+        
+    def _signature(self, data: Dict[str, Any]) -> str:
+        """Compute the signature of unsigned data
+        
+        Shared by signing and verification. Verification always
+        re-serializes: stored content is mutable, and a memoized signature
+        would hide tampering.
+        
+        Args:
+            data: Data without signature fields
+            
+        Returns:
+            str: Hex signature
+        """
+        signature_data = _encode_sorted_json(data) + self.blockchain.shared_keys["verification"]
+        return _sha256(signature_data.encode()).hexdigest()
 
 # Example usage of the DGLA blockchain store
 if __name__ == "__main__":
@@ -437,3 +1152,12 @@ if __name__ == "__main__":
     # Verify integrity again
     valid, message = store.verify_integrity()
     print(f"Blockchain integrity after tampering: {valid}, {message}")
+    
+    # Tamper with a dict nested inside a tuple, which must be caught too
+    chain = DGLABlockchain()
+    chain.add_data({"t": ({"z": 1},)})
+    chain.mine_pending_data()
+    chain.chain[1].data["entries"][0]["t"][0]["z"] = 2
+    valid, message = chain.verify_chain_integrity()
+    print(f"Integrity after editing tuple-nested data: {valid}, {message}")
+    assert message == "Block 1 hash invalid", "edit inside a tuple was not detected"
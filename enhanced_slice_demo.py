@@ -27,6 +27,8 @@ logger = logging.getLogger("Rogers5G-Enhanced")
 class NetworkSlice:
     """Represents a 5G network slice with cryptographic verification"""
     
+    __slots__ = ("slice_id", "type_name", "priority", "resources", "created_at", "dgla_id")
+    
     def __init__(self, slice_id, type_name, priority, resources):
         """Initialize a network slice"""
         self.slice_id = slice_id
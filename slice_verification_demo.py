@@ -21,30 +21,116 @@ Solution:
 """
 
 import os
-import sys
+import copy
 import time
 import hashlib
-import json
-import uuid
 import datetime
-import random
-from urllib.request import urlopen, Request
+import itertools
+import secrets
+import threading
+from collections import deque
 import logging
+from tracked_json import (track as _track, encode_scalar as _encode_scalar,
+                          encode_sorted_json as _encode_config)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger("Rogers5G-NetworkSliceVerification")
 
 # DGLA API connection settings
 DGLA_API_URL = None
 DEFAULT_API_URL = "http://localhost:8080"
 
+# Most recent events kept in memory per slice and per manager
+EVENT_LOG_SIZE = 1024
+
+# Slice fields covered by the verification hash
+_CONFIG_FIELDS = frozenset(("slice_id", "type_name", "priority", "resources", "created_at"))
+# Fixed key fragments of a slice's canonical (sorted-key) JSON form
+_CANON_CREATED_AT = '{"created_at": '
+_CANON_PRIORITY = ', "priority": '
+_CANON_RESOURCES = ', "resources": '
+_CANON_SLICE_ID = ', "slice_id": '
+_CANON_TYPE_NAME = ', "type_name": '
+
+# Random bytes for identifiers are read in chunks instead of once per ID
+_ID_CHUNK_SIZE = 16 * 256
+_id_pool = bytearray()
+_id_lock = threading.Lock()
+
+def _new_id():
+    """Generate a random UUID4-formatted identifier
+    
+    Returns:
+        str: Identifier in canonical 8-4-4-4-12 hex form
+    """
+    global _id_pool
+    # Taking the bytes and dropping them from the pool must be one step,
+    # or two threads could hand out the same identifier
+    with _id_lock:
+        if not _id_pool:
+            _id_pool = bytearray(os.urandom(_ID_CHUNK_SIZE))
+        raw = _id_pool[-16:]
+        del _id_pool[-16:]
+    raw[6] = raw[6] & 0x0F | 0x40  # version 4
+    raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+def _reset_id_pool():
+    """Discard the buffered random bytes in a forked child
+    
+    The child would otherwise hand out the same identifiers as its parent.
+    The lock is replaced too, in case another thread held it at fork time.
+    """
+    global _id_pool, _id_lock
+    _id_pool = bytearray()
+    _id_lock = threading.Lock()
+
+# Audit event IDs only have to be unique, not unguessable: a random
+# per-process prefix plus a counter avoids drawing randomness per event
+_EVENT_ID_PREFIX = secrets.token_hex(8)
+_event_counter = itertools.count(1)
+
+def _new_event_id():
+    """Generate an identifier for an internal audit event
+    
+    Returns:
+        str: Process prefix and hex sequence number
+    """
+    return f"{_EVENT_ID_PREFIX}-{next(_event_counter):x}"
+
+def _reset_event_ids():
+    """Give a forked child its own event ID prefix
+    
+    The child inherits the parent's prefix and counter position, so both
+    would otherwise number their next events identically.
+    """
+    global _EVENT_ID_PREFIX
+    _EVENT_ID_PREFIX = secrets.token_hex(8)
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+    os.register_at_fork(after_in_child=_reset_event_ids)
+
+def _format_events(events):
+    """Attach ISO timestamps to recorded events
+    
+    Args:
+        events: Events stamped with time.time_ns()
+        
+    Returns:
+        list: Copies of the events with a "timestamp" field added
+    """
+    fromtimestamp = datetime.datetime.fromtimestamp
+    return [dict(event, timestamp=fromtimestamp(event["timestamp_ns"] / 1e9).isoformat())
+            for event in events]
+
 class NetworkSlice:
     """Represents a 5G network slice with cryptographic verification"""
     
+    __slots__ = ("slice_id", "type_name", "priority", "resources", "created_at",
+                 "verification_hash", "audit_events", "_canonical", "_resources_json",
+                 "_trusted_fields", "_trusted_config")
+    
     def __init__(self, slice_id, type_name, priority, resources):
         """Initialize a network slice
         
@@ -54,29 +140,84 @@ class NetworkSlice:
             priority: Priority level (0-100, higher is more important)
             resources: Dict of resource allocations
         """
+        self._canonical = None
+        self._resources_json = None
         self.slice_id = slice_id
         self.type_name = type_name
         self.priority = priority
         self.resources = resources
         self.created_at = datetime.datetime.now().isoformat()
         self.verification_hash = self._generate_verification_hash()
-        self.audit_events = []
+        # Field values and canonical bytes behind verification_hash, kept as
+        # the trusted record; the values are deep copies so later edits to
+        # the live fields cannot reach them
+        self._trusted_fields = {name: copy.deepcopy(getattr(self, name))
+                                for name in _CONFIG_FIELDS}
+        self._trusted_config = self._canonical
+        self.audit_events = deque(maxlen=EVENT_LOG_SIZE)
+        
+    def __setattr__(self, name, value):
+        if name == "resources":
+            # Track nested edits so they invalidate the cached config too
+            value = _track(value, self)
+        object.__setattr__(self, name, value)
+        if name in _CONFIG_FIELDS:
+            object.__setattr__(self, "_canonical", None)
+            if name == "resources":
+                object.__setattr__(self, "_resources_json", None)
+            
+    def _touch(self):
+        """Record a mutation of the resources, invalidating the cached config"""
+        self._canonical = None
+        self._resources_json = None
+        
+    def _canonical_config(self):
+        """Serialize the slice configuration in canonical form
+        
+        The bytes are cached until a configuration field is reassigned or
+        the resources are edited, so repeated verification of an
+        unchanged slice only re-hashes them. The schema is fixed, so the
+        text is assembled from its key fragments in sorted order; only the
+        resources go through the JSON encoder, and their encoding is kept
+        across changes to the other fields.
+        
+        Returns:
+            bytes: Sorted-key JSON encoding of the slice configuration,
+                identical to json.dumps(config, sort_keys=True)
+        """
+        if self._canonical is not None:
+            return self._canonical
+            
+        resources_json = self._resources_json
+        if resources_json is None:
+            resources_json = self._resources_json = _encode_config(self.resources)
+            
+        self._canonical = (_CANON_CREATED_AT + _encode_scalar(self.created_at) +
+                           _CANON_PRIORITY + _encode_scalar(self.priority) +
+                           _CANON_RESOURCES + resources_json +
+                           _CANON_SLICE_ID + _encode_scalar(self.slice_id) +
+                           _CANON_TYPE_NAME + _encode_scalar(self.type_name) + '}').encode()
+        return self._canonical
+        
+    def restore_trusted_config(self):
+        """Restore the configuration fields from the trusted record
+        
+        The original field values are restored, not a decoding of the
+        canonical bytes, so key and container types survive and the fields
+        encode to those bytes again. The bytes themselves are reused as the
+        cached encoding, so the restored slice verifies without re-hashing.
+        """
+        for name, value in self._trusted_fields.items():
+            setattr(self, name, copy.deepcopy(value))
+        self._canonical = self._trusted_config
         
     def _generate_verification_hash(self):
         """Generate a cryptographic hash of the slice configuration
         
         Returns:
-            str: Hash representing the slice configuration
+            bytes: Raw SHA-256 digest of the slice configuration
         """
-        config_str = json.dumps({
-            "slice_id": self.slice_id,
-            "type_name": self.type_name,
-            "priority": self.priority,
-            "resources": self.resources,
-            "created_at": self.created_at
-        }, sort_keys=True)
-        
-        return hashlib.sha256(config_str.encode()).hexdigest()
+        return hashlib.sha256(self._canonical_config()).digest()
         
     def verify_integrity(self):
         """Verify that the slice hasn't been tampered with
@@ -87,27 +228,40 @@ class NetworkSlice:
         current_hash = self._generate_verification_hash()
         return current_hash == self.verification_hash
         
-    def log_event(self, event_type, details):
+    def log_event(self, event_type, details, timestamp_ns=None):
         """Log an audit event for this slice
         
         Args:
             event_type: Type of event
             details: Dict with event details
+            timestamp_ns: Event time from time.time_ns(); read from the
+                clock when omitted, so callers can stamp a batch once
         
         Returns:
             str: Event ID
         """
-        event_id = str(uuid.uuid4())
+        event_id = _new_event_id()
         event = {
             "event_id": event_id,
             "event_type": event_type,
             "slice_id": self.slice_id,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns() if timestamp_ns is None else timestamp_ns,
             "details": details
         }
         self.audit_events.append(event)
         return event_id
         
+    def get_audit_events(self):
+        """Get the audit events for this slice
+        
+        Events are stamped with time.time_ns() when logged; the ISO
+        timestamp is only formatted here.
+        
+        Returns:
+            list: Audit events with ISO timestamps
+        """
+        return _format_events(self.audit_events)
+        
     def submit_to_dgla(self, api_url):
         """Submit slice information to DGLA for immutable storage
         
@@ -117,75 +271,132 @@ class NetworkSlice:
         Returns:
             str: Submission ID from DGLA
         """
-        # In a real implementation, this would make an API call to DGLA
-        # For demo purposes, we'll simulate the response
-        submission_id = f"{self.slice_id}-{uuid.uuid4()}"
-        logger.info(f"Slice {self.slice_id} submitted to DGLA: {submission_id}")
-        return submission_id
+        return submit_slices_to_dgla([self], api_url)[0]
+
+def submit_slices_to_dgla(slices, api_url):
+    """Submit several slices to DGLA for immutable storage in one request
+    
+    Args:
+        slices: NetworkSlice objects to submit
+        api_url: URL of the DGLA API
+        
+    Returns:
+        list: Submission IDs from DGLA, in the order of the slices
+    """
+    # In a real implementation, this would make a single API call to DGLA
+    # carrying every slice, instead of one round trip per slice
+    # For demo purposes, we'll simulate the response
+    submission_ids = []
+    for slice in slices:
+        submission_id = f"{slice.slice_id}-{_new_id()}"
+        logger.info(f"Slice {slice.slice_id} submitted to DGLA: {submission_id}")
+        submission_ids.append(submission_id)
+    return submission_ids
 
 class SliceManager:
     """Manages and monitors network slices"""
     
-    def __init__(self, api_url):
+    def __init__(self, api_url, event_log_size=EVENT_LOG_SIZE):
         """Initialize a slice manager
         
         Args:
             api_url: URL of the DGLA API
+            event_log_size: Number of recent global events kept in memory
         """
         self.api_url = api_url
         self.slices = {}
-        self.events = []
+        self.events = deque(maxlen=event_log_size)
+        # Total events recorded, including those rotated out of self.events
+        self.event_count = 0
         
-    def create_slice(self, type_name, priority, resources):
+    def create_slice(self, type_name, priority, resources, timestamp_ns=None):
         """Create a new network slice
         
         Args:
             type_name: Type of slice
             priority: Priority level
             resources: Dict of resource allocations
+            timestamp_ns: Time to stamp the creation events with; the clock
+                is read once for both events when omitted
             
         Returns:
             NetworkSlice: The created slice
         """
-        slice_id = str(uuid.uuid4())[:8]
-        slice = NetworkSlice(slice_id, type_name, priority, resources)
-        self.slices[slice_id] = slice
+        return self.create_slices([(type_name, priority, resources)], timestamp_ns)[0]
         
-        # Submit to DGLA for immutable storage
-        submission_id = slice.submit_to_dgla(self.api_url)
-        
-        # Log the creation event
-        event_id = slice.log_event("creation", {
-            "submission_id": submission_id,
-            "resources": resources
-        })
-        
-        # Record global event
-        self._record_event("slice_created", {
-            "slice_id": slice_id,
-            "event_id": event_id,
-            "type_name": type_name,
-            "priority": priority
-        })
+    def create_slices(self, specs, timestamp_ns=None):
+        """Create several network slices and submit them to DGLA together
         
-        return slice
+        Args:
+            specs: (type_name, priority, resources) tuple for each slice
+            timestamp_ns: Time to stamp the creation events with; the clock
+                is read once for the whole batch when omitted
+            
+        Returns:
+            list: The created slices, in the order of specs
+        """
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+            
+        specs = list(specs)
+        slices = []
+        for type_name, priority, resources in specs:
+            slice_id = _new_id()[:8]
+            slice = NetworkSlice(slice_id, type_name, priority, resources)
+            self.slices[slice_id] = slice
+            slices.append(slice)
+            
+        # Submit to DGLA for immutable storage
+        submission_ids = submit_slices_to_dgla(slices, self.api_url)
+        
+        for slice, submission_id, (type_name, priority, resources) in zip(
+                slices, submission_ids, specs):
+            # Log the creation event
+            event_id = slice.log_event("creation", {
+                "submission_id": submission_id,
+                "resources": resources
+            }, timestamp_ns)
+            
+            # Record global event
+            self._record_event("slice_created", {
+                "slice_id": slice.slice_id,
+                "event_id": event_id,
+                "type_name": type_name,
+                "priority": priority
+            }, timestamp_ns)
+            
+        return slices
         
     def verify_all_slices(self):
         """Verify the integrity of all slices
         
+        All configurations are serialized first and then hashed together
+        in one pass, rather than interleaving per-slice calls. The fresh
+        digests are compared against the slices' verification hashes as
+        whole lists, and only walked one by one when something differs.
+        The rows are taken from self.slices on every call, so slices added
+        or removed there are always what gets verified.
+        
         Returns:
             tuple: (verified_count, total_count, compromised_ids)
         """
-        verified_count = 0
-        compromised_ids = []
-        
-        for slice_id, slice in self.slices.items():
-            if slice.verify_integrity():
-                verified_count += 1
-            else:
-                compromised_ids.append(slice_id)
-                
-        return (verified_count, len(self.slices), compromised_ids)
+        sha256 = hashlib.sha256
+        slices = list(self.slices.values())
+        payloads = [slice._canonical_config() for slice in slices]
+        current_hashes = [sha256(payload).digest() for payload in payloads]
+        trusted_hashes = [slice.verification_hash for slice in slices]
+        
+        total_count = len(current_hashes)
+        if current_hashes == trusted_hashes:
+            return (total_count, total_count, [])
+            
+        compromised_ids = [
+            slice_id
+            for slice_id, current_hash, trusted_hash
+            in zip(self.slices, current_hashes, trusted_hashes)
+            if current_hash != trusted_hash
+        ]
+        return (total_count - len(compromised_ids), total_count, compromised_ids)
         
     def simulate_attack(self, slice_id):
         """Simulate an attack on a slice by tampering with its priority
@@ -213,11 +424,13 @@ class SliceManager:
         
         return True
         
-    def remediate_slice(self, slice_id):
+    def remediate_slice(self, slice_id, timestamp_ns=None):
         """Remediate a compromised slice by restoring from DGLA
         
         Args:
             slice_id: ID of the slice to remediate
+            timestamp_ns: Time to stamp the remediation events with; the
+                clock is read once for both events when omitted
             
         Returns:
             bool: True if remediation was successful
@@ -225,59 +438,67 @@ class SliceManager:
         if slice_id not in self.slices:
             return False
             
+        if timestamp_ns is None:
+            timestamp_ns = time.time_ns()
+            
         # In a real implementation, this would retrieve the slice configuration from DGLA
-        # For demo purposes, we'll simulate restoration by regenerating the verification hash
+        # For demo purposes, we'll restore it from the record taken at creation
         slice = self.slices[slice_id]
-        slice.verification_hash = slice._generate_verification_hash()
+        slice.restore_trusted_config()
         
         # Log the remediation event
-        event_id = slice.log_event("remediation", {
-            "timestamp": datetime.datetime.now().isoformat()
-        })
+        event_id = slice.log_event("remediation", {}, timestamp_ns)
         
         # Record global event
         self._record_event("slice_remediated", {
             "slice_id": slice_id,
             "event_id": event_id
-        })
+        }, timestamp_ns)
         
         return True
         
-    def _record_event(self, event_type, details):
+    def _record_event(self, event_type, details, timestamp_ns=None):
         """Record a global event
         
         Args:
             event_type: Type of event
             details: Dict with event details
+            timestamp_ns: Event time from time.time_ns(); read from the
+                clock when omitted, so callers can stamp a batch once
         
         Returns:
             str: Event ID
         """
-        event_id = str(uuid.uuid4())
+        event_id = _new_event_id()
         event = {
             "event_id": event_id,
             "event_type": event_type,
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns() if timestamp_ns is None else timestamp_ns,
             "details": details
         }
         self.events.append(event)
+        self.event_count += 1
         return event_id
         
     def generate_report(self):
         """Generate a report of all slices and events
         
+        Event timestamps are formatted to ISO 8601 here rather than when
+        each event is recorded.
+        
         Returns:
             dict: Report data
         """
         return {
             "timestamp": datetime.datetime.now().isoformat(),
             "slice_count": len(self.slices),
-            "event_count": len(self.events),
+            "event_count": self.event_count,
             "slice_types": {
                 slice.type_name: slice.priority
                 for slice in self.slices.values()
             },
-            "recent_events": self.events[-5:] if self.events else []
+            "recent_events": _format_events(
+                itertools.islice(self.events, max(len(self.events) - 5, 0), None))
         }
 
 def run_demo(api_url=None):
@@ -286,6 +507,13 @@ def run_demo(api_url=None):
     Args:
         api_url: URL of the DGLA API
     """
+    # Configure logging here rather than at import, so importing the
+    # module as a library leaves the host application's logging alone
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     global DGLA_API_URL
     DGLA_API_URL = api_url or DEFAULT_API_URL
     
@@ -300,41 +528,43 @@ def run_demo(api_url=None):
     
     # Create network slices
     print("1. Creating network slices with cryptographic verification...")
-    emergency_slice = manager.create_slice(
-        "emergency", 
-        100,  # Highest priority
-        {
-            "bandwidth_mbps": 500,
-            "latency_ms": 5,
-            "reliability_percent": 99.999,
-            "max_devices": 10000
-        }
-    )
+    # The slices are provisioned together: one DGLA submission and one
+    # timestamp cover the whole batch
+    emergency_slice, consumer_slice, iot_slice = manager.create_slices([
+        (
+            "emergency", 
+            100,  # Highest priority
+            {
+                "bandwidth_mbps": 500,
+                "latency_ms": 5,
+                "reliability_percent": 99.999,
+                "max_devices": 10000
+            }
+        ),
+        (
+            "consumer", 
+            50,  # Medium priority
+            {
+                "bandwidth_mbps": 100,
+                "latency_ms": 20,
+                "reliability_percent": 99.9,
+                "max_devices": 1000000
+            }
+        ),
+        (
+            "iot", 
+            30,  # Lower priority
+            {
+                "bandwidth_mbps": 10,
+                "latency_ms": 50,
+                "reliability_percent": 99.0,
+                "max_devices": 5000000
+            }
+        )
+    ])
     print(f"  ✓ Emergency Services slice created with ID: {emergency_slice.slice_id}")
-    print(f"  ✓ Cryptographic verification hash: {emergency_slice.verification_hash[:8]}...")
-    
-    consumer_slice = manager.create_slice(
-        "consumer", 
-        50,  # Medium priority
-        {
-            "bandwidth_mbps": 100,
-            "latency_ms": 20,
-            "reliability_percent": 99.9,
-            "max_devices": 1000000
-        }
-    )
+    print(f"  ✓ Cryptographic verification hash: {emergency_slice.verification_hash.hex()[:8]}...")
     print(f"  ✓ Consumer slice created with ID: {consumer_slice.slice_id}")
-    
-    iot_slice = manager.create_slice(
-        "iot", 
-        30,  # Lower priority
-        {
-            "bandwidth_mbps": 10,
-            "latency_ms": 50,
-            "reliability_percent": 99.0,
-            "max_devices": 5000000
-        }
-    )
     print(f"  ✓ IoT slice created with ID: {iot_slice.slice_id}")
     print(f"  ✓ All slices registered in DGLA with cryptographic proofs\n")
     
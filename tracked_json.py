@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Mutation-Tracked JSON Data
+--------------------------
+
+Containers that report every edit to an owner object, plus the canonical
+JSON encoding helpers shared by the DGLA blockchain store and the slice
+verification demo. An owner is any object with a _touch() method.
+"""
+
+import json
+from typing import Dict, List, Any
+
+_encode_json_string = json.encoder.encode_basestring_ascii
+# json.dumps(..., sort_keys=True) builds a fresh encoder on every call;
+# every canonical encoding shares this one
+encode_sorted_json = json.JSONEncoder(sort_keys=True).encode
+
+def encode_scalar(value: Any) -> str:
+    """JSON-encode a scalar field, skipping the general encoder for the usual types
+    
+    Args:
+        value: Field value
+        
+    Returns:
+        str: Same text json.dumps(value, sort_keys=True) would produce
+    """
+    value_type = type(value)
+    if value_type is str:
+        return _encode_json_string(value)
+    if value_type is int:
+        return int.__repr__(value)
+    return encode_sorted_json(value)
+
+def track(value: Any, owner: Any) -> Any:
+    """Wrap nested dicts and lists so their mutations reach the owner
+    
+    Args:
+        value: Value being stored in the owner's tracked data
+        owner: Object with a _touch() method, called on every mutation
+        
+    Returns:
+        Any: Versioned container, or the value unchanged if it is a scalar
+    """
+    if isinstance(value, dict):
+        if isinstance(value, VersionedDict) and value._owner is owner:
+            return value
+        return VersionedDict(owner, value)
+    if isinstance(value, list):
+        if isinstance(value, VersionedList) and value._owner is owner:
+            return value
+        return VersionedList(owner, value)
+    if isinstance(value, tuple):
+        # Tuples cannot change, but containers inside them can
+        items = [track(item, owner) for item in value]
+        if any(item is not original for item, original in zip(items, value)):
+            return tuple(items)
+    return value
+
+class VersionedDict(dict):
+    """Dictionary that calls its owner's _touch() on every mutation"""
+    
+    __slots__ = ("_owner",)
+    
+    def __init__(self, owner: Any, items: Dict[str, Any]):
+        """Initialize a tracked copy of a dictionary
+        
+        Args:
+            owner: Object holding this dictionary, with a _touch() method
+            items: Contents to copy, nested containers are tracked too
+        """
+        self._owner = owner
+        dict.__init__(self, ((key, track(value, owner)) for key, value in items.items()))
+        
+    def __reduce__(self):
+        return (VersionedDict, (self._owner, dict(self)))
+        
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, track(value, self._owner))
+        self._owner._touch()
+        
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._owner._touch()
+        
+    def __ior__(self, other):
+        self.update(other)
+        return self
+        
+    def pop(self, *args):
+        value = dict.pop(self, *args)
+        self._owner._touch()
+        return value
+        
+    def popitem(self):
+        item = dict.popitem(self)
+        self._owner._touch()
+        return item
+        
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+        
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            dict.__setitem__(self, key, track(value, self._owner))
+        self._owner._touch()
+        
+    def clear(self):
+        dict.clear(self)
+        self._owner._touch()
+
+class VersionedList(list):
+    """List that calls its owner's _touch() on every mutation"""
+    
+    __slots__ = ("_owner",)
+    
+    def __init__(self, owner: Any, items: List[Any]):
+        """Initialize a tracked copy of a list
+        
+        Args:
+            owner: Object holding this list, with a _touch() method
+            items: Contents to copy, nested containers are tracked too
+        """
+        self._owner = owner
+        list.__init__(self, (track(value, owner) for value in items))
+        
+    def __reduce__(self):
+        return (VersionedList, (self._owner, list(self)))
+        
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [track(item, self._owner) for item in value]
+        else:
+            value = track(value, self._owner)
+        list.__setitem__(self, index, value)
+        self._owner._touch()
+        
+    def __delitem__(self, index):
+        list.__delitem__(self, index)
+        self._owner._touch()
+        
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+        
+    def __imul__(self, count):
+        list.__imul__(self, count)
+        self._owner._touch()
+        return self
+        
+    def append(self, value):
+        list.append(self, track(value, self._owner))
+        self._owner._touch()
+        
+    def extend(self, values):
+        list.extend(self, [track(value, self._owner) for value in values])
+        self._owner._touch()
+        
+    def insert(self, index, value):
+        list.insert(self, index, track(value, self._owner))
+        self._owner._touch()
+        
+    def pop(self, *args):
+        value = list.pop(self, *args)
+        self._owner._touch()
+        return value
+        
+    def remove(self, value):
+        list.remove(self, value)
+        self._owner._touch()
+        
+    def clear(self):
+        list.clear(self)
+        self._owner._touch()
+        
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._owner._touch()
+        
+    def reverse(self):
+        list.reverse(self)
+        self._owner._touch()